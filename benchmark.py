@@ -0,0 +1,156 @@
+#!/usr/bin/env python
+"""
+Offline benchmarks for the Citizen client.
+
+All network benchmarks run against a local MockCitizenServer, so the numbers are reproducible and never touch the
+live service.
+"""
+
+import argparse
+import gc
+import json
+import logging
+import random
+import statistics
+import time
+import tracemalloc
+
+import requests
+
+import citizenpy
+from citizenpy.mock_server import MockCitizenServer, make_incident, make_incident_id
+from citizenpy.models import IncidentV1
+from citizenpy.serialization import OrjsonSerializer, StdlibJsonSerializer, default_serializer
+
+
+def make_payloads(count, updates, text_size):
+    rng = random.Random(0)
+    return [make_incident(make_incident_id(n), updates, text_size, rng) for n in range(count)]
+
+
+def bench_parse(payloads, repeat):
+    """
+    Measures how fast JsonType models are hydrated from already decoded JSON
+    """
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for payload in payloads:
+            IncidentV1(payload)
+        timings.append(time.perf_counter() - start)
+    best = min(timings)
+    print('parse:      {:10.0f} incidents/s  (best of {}, {} incidents)'.format(
+        len(payloads) / best, repeat, len(payloads)))
+
+
+def bench_memory(payloads):
+    """
+    Measures memory held by hydrated IncidentV1 objects, scaled to 10k incidents.
+    Payloads are decoded from bytes inside the traced window, since models keep references to the decoded strings.
+    """
+    raw_payloads = [json.dumps(payload).encode('utf-8') for payload in payloads]
+    gc.collect()
+    tracemalloc.start()
+    decoded = [json.loads(raw) for raw in raw_payloads]
+    incidents = [IncidentV1(payload) for payload in decoded]
+    del decoded
+    gc.collect()
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    scale = 10000 / len(incidents)
+    print('memory:     {:10.2f} MB per 10k incidents  (peak {:.2f} MB)'.format(
+        current * scale / 2**20, peak * scale / 2**20))
+
+
+def bench_throughput(session, requests_count, limit):
+    """
+    Measures sequential request throughput against the mock server
+    """
+    errors = 0
+    start = time.perf_counter()
+    for _ in range(requests_count):
+        try:
+            session.get_nearby_incident_ids(min_lat=40.6, max_lat=40.8, min_long=-74.1, max_long=-73.9, limit=limit)
+        except requests.HTTPError:
+            errors += 1
+    elapsed = time.perf_counter() - start
+    print('throughput: {:10.1f} requests/s  ({} requests, {} errors)'.format(
+        requests_count / elapsed, requests_count, errors))
+
+
+def bench_hydration(session, incident_ids, repeat, page_size):
+    """
+    Measures end-to-end latency of fetching and hydrating incidents, one batch page at a time.
+    Failed pages are counted and skipped, so latency is still measured when errors are injected.
+    """
+    timings = []
+    errors = 0
+    for _ in range(repeat):
+        for i in range(0, len(incident_ids), page_size):
+            page_ids = incident_ids[i:i+page_size]
+            start = time.perf_counter()
+            try:
+                session.get_incidents_v1(page_ids, page_size=page_size)
+            except requests.HTTPError:
+                errors += 1
+                continue
+            timings.append(time.perf_counter() - start)
+    pages = len(timings) + errors
+    if not timings:
+        print('hydration:  all {} pages failed'.format(pages))
+        return
+    timings.sort()
+    p95 = timings[min(len(timings) - 1, int(len(timings) * 0.95))]
+    print('hydration:  {:10.1f} ms median, {:.1f} ms p95 per page  ({} incidents/page, {} pages, {} failed)'.format(
+        statistics.median(timings) * 1000, p95 * 1000, page_size, pages, errors))
+
+
+SERIALIZERS = {
+    'auto': default_serializer,
+    'json': StdlibJsonSerializer,
+    'orjson': OrjsonSerializer,
+}
+
+
+def main(log_level, incidents, updates, text_size, latency, error_rate, compression, serializer, requests_count,
+         repeat, page_size):
+    logging.basicConfig(level=log_level, format='%(asctime)s [%(levelname)s]:%(message)s')
+
+    payloads = make_payloads(incidents, updates, text_size)
+    bench_parse(payloads, repeat)
+    bench_memory(payloads)
+
+    with MockCitizenServer(
+            incident_count=incidents,
+            updates_per_incident=updates,
+            text_size=text_size,
+            latency=latency,
+            error_rate=error_rate,
+            compression=compression) as server:
+        client = citizenpy.Client(
+            api_service_url=server.url,
+            data_service_url=server.url,
+            serializer=SERIALIZERS[serializer]())
+        session = client.guest_session()
+        bench_throughput(session, requests_count, limit=page_size)
+        bench_hydration(session, server.incident_ids, repeat, page_size)
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Offline client benchmarks')
+    parser.add_argument('--log-level', type=int, nargs='?', dest='log_level',
+                        help='Sets logging level', default=logging.WARNING, required=False)
+    parser.add_argument('--incidents', type=int, default=10000, help='Number of synthetic incidents')
+    parser.add_argument('--updates', type=int, default=3, help='Number of updates per incident')
+    parser.add_argument('--text-size', type=int, default=64, help='Approximate length of synthetic texts')
+    parser.add_argument('--latency', type=float, default=0.0, help='Delay in seconds added by the mock server')
+    parser.add_argument('--error-rate', type=float, default=0.0, help='Fraction of mock requests failing with HTTP 500')
+    parser.add_argument('--no-compression', action='store_false', dest='compression',
+                        help='Disable gzip responses from the mock server')
+    parser.add_argument('--serializer', default='auto', choices=sorted(SERIALIZERS),
+                        help='JSON serializer used by the client')
+    parser.add_argument('--requests', type=int, default=200, dest='requests_count',
+                        help='Number of requests for the throughput benchmark')
+    parser.add_argument('--repeat', type=int, default=5, help='Number of runs for the parse and hydration benchmarks')
+    parser.add_argument('--page-size', type=int, default=100, help='Incidents per batch request')
+    main(**parser.parse_args().__dict__)
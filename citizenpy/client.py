@@ -5,6 +5,7 @@ from typing import List
 import requests
 
 from citizenpy.models import IncidentId, IncidentV1, UserInfo
+from citizenpy.serialization import JsonSerializer, default_serializer
 
 from citizenpy.token_util import parse_jwt_token, create_guest_token
 
@@ -27,12 +28,30 @@ class Client(object):
     """
     Main client class
     """
-    def __init__(self, user_agent=DEFAULT_USER_AGENT):
+    def __init__(self,
+                 user_agent=DEFAULT_USER_AGENT,
+                 api_service_url=API_SERVICE_URL,
+                 data_service_url=DATA_SERVICE_URL,
+                 serializer: JsonSerializer=None):
+        """
+        :param user_agent: User Agent string to use when making requests
+        :param api_service_url: base URL of the API (user/auth) service
+        :param data_service_url: base URL of the data (incidents/radio/geo) service
+        :param serializer: JSON serializer for requests and responses, defaults to the fastest one available
+        """
         self.user_agent = user_agent
+        self.api_service_url = api_service_url
+        self.data_service_url = data_service_url
+        self.serializer = serializer
 
     def guest_session(self):
         token = create_guest_token()
-        requestor = Requestor(token=token, user_agent=self.user_agent)
+        requestor = Requestor(
+            token=token,
+            user_agent=self.user_agent,
+            api_service_url=self.api_service_url,
+            data_service_url=self.data_service_url,
+            serializer=self.serializer)
         return GuestSession(requestor)
 
     def auth_session(self, username, password):
@@ -43,15 +62,28 @@ class Requestor(object):
     """
     API session that manages tokens
     """
-    def __init__(self, token, user_agent=DEFAULT_USER_AGENT):
+    def __init__(self,
+                 token,
+                 user_agent=DEFAULT_USER_AGENT,
+                 api_service_url=API_SERVICE_URL,
+                 data_service_url=DATA_SERVICE_URL,
+                 serializer: JsonSerializer=None):
         """
         Creates a session object with a given token
         :param token: sessio token
         :param user_agent: User Agent string to use when making requests
+        :param api_service_url: base URL of the API (user/auth) service
+        :param data_service_url: base URL of the data (incidents/radio/geo) service
+        :param serializer: JSON serializer for requests and responses, defaults to the fastest one available
         """
         self.token = token
         self.parsed_token = parse_jwt_token(self.token)
         self.user_agent = user_agent
+        self.api_service_url = api_service_url
+        self.data_service_url = data_service_url
+        if serializer is None:
+            serializer = default_serializer()
+        self.serializer = serializer
 
     def set_token(self, token: str):
         """
@@ -124,7 +156,7 @@ class Requestor(object):
         """
         result = requests.get(host + path, params=params, headers=self._get_headers())
         if result.status_code == requests.codes.ok:
-            return result.json()  # TODO: catch errors
+            return self.serializer.loads(result.content)  # TODO: catch errors
         self.raise_for_status(result)
 
     def post(self, host: str, path: str, params: dict) -> dict:
@@ -135,10 +167,9 @@ class Requestor(object):
         :param params: parameters as a dict
         :return:
         """
-        print (params)
-        result = requests.post(host + path, json=params, headers=self._get_headers())
+        result = requests.post(host + path, data=self.serializer.dumps(params), headers=self._get_headers())
         if result.status_code == requests.codes.ok:
-            return result.json()  # TODO: catch errors
+            return self.serializer.loads(result.content)  # TODO: catch errors
         # result_json = result.json()
         # raise CitizenException(result.status_code, result_json['error'])
         result.raise_for_status()
@@ -177,7 +208,7 @@ class GuestSession(object):
             min_lat, max_lat = max_lat, min_lat
         if max_long < min_long:
             min_long, max_long = max_long, min_long
-        result = self.requestor.get(DATA_SERVICE_URL, '/v1/incidents/nearby', {
+        result = self.requestor.get(self.requestor.data_service_url, '/v1/incidents/nearby', {
             'upperLatitude': max_lat,
             'lowerLatitude': min_lat,
             'upperLongitude': max_long,
@@ -193,7 +224,7 @@ class GuestSession(object):
         all_incidents = []
         for i in range(0, len(incident_ids), page_size):
             page_ids = incident_ids[i:i+page_size]
-            result = self.requestor.get(DATA_SERVICE_URL, '/gnet/incidents1/batch', {
+            result = self.requestor.get(self.requestor.data_service_url, '/gnet/incidents1/batch', {
                 'incidentIds': ','.join(page_ids)
             })
             incidents = result.get('incidents', [])
@@ -216,7 +247,7 @@ class GuestSession(object):
         if max_long < min_long:
             min_long, max_long = max_long, min_long
 
-        result = self.requestor.post(DATA_SERVICE_URL, '/gnet/incidents1/query', {
+        result = self.requestor.post(self.requestor.data_service_url, '/gnet/incidents1/query', {
             'since': datetime_to_str_millis(since),
             'bounds': {
                 'upperLatitude': max_lat,
@@ -243,7 +274,7 @@ class GuestSession(object):
         if max_long < min_long:
             min_long, max_long = max_long, min_long
 
-        result = self.requestor.post(DATA_SERVICE_URL, '/incidents2/query', {
+        result = self.requestor.post(self.requestor.data_service_url, '/incidents2/query', {
             'since': datetime_to_str_millis(since),
             'bounds': {
                 'upperLatitude': max_lat,
@@ -256,55 +287,60 @@ class GuestSession(object):
         return result['incidentIds']
 
     def get_leaders(self):
-        result = self.requestor.get(DATA_SERVICE_URL, '/radio/leaders')
+        result = self.requestor.get(self.requestor.data_service_url, '/radio/leaders')
         return result['leaders']
 
     def get_clips(self, channels):
-        result = self.requestor.post(DATA_SERVICE_URL, '/radio/clips', {
+        result = self.requestor.post(self.requestor.data_service_url, '/radio/clips', {
             'channels': channels
         })
         # Server can return {'clips': null} so we have to handle this case and always return an iterable
         return result.get('clips') or []
 
     def get_sub_areas(self):
-        result = self.requestor.get(DATA_SERVICE_URL, '/radio/sub_areas')
+        result = self.requestor.get(self.requestor.data_service_url, '/radio/sub_areas')
         return result.get('SubAreas') or []
 
     def get_channels(self):
-        result = self.requestor.get(DATA_SERVICE_URL, '/v2/radio/channels')
+        result = self.requestor.get(self.requestor.data_service_url, '/v2/radio/channels')
         return result.get('channels') or []
 
     def get_suggested_radius(self, latitude, longitude):
-        result = self.requestor.get(DATA_SERVICE_URL, '/signal/suggested_radius', {
+        result = self.requestor.get(self.requestor.data_service_url, '/signal/suggested_radius', {
             'lat': latitude, 'long': longitude
         })
         return result
 
     def get_service_area_code(self, latitude, longitude):
-        result = self.requestor.get(DATA_SERVICE_URL, '/signal/service_area_code', {
+        result = self.requestor.get(self.requestor.data_service_url, '/signal/service_area_code', {
             'lat': latitude, 'long': longitude
         })
         return result
 
     def get_neighborhoods(self, latitude, longitude):
-        result = self.requestor.get(DATA_SERVICE_URL, '/geo/neighborhoods', {
+        result = self.requestor.get(self.requestor.data_service_url, '/geo/neighborhoods', {
             'lat': latitude, 'long': longitude
         })
         return result.get('results') or []
 
     def get_precincts(self, latitude, longitude):
-        result = self.requestor.get(DATA_SERVICE_URL, '/geo/precincts', {
+        result = self.requestor.get(self.requestor.data_service_url, '/geo/precincts', {
             'lat': latitude, 'long': longitude
         })
         return result.get('results') or []
 
     def authenticate(self, username, password):
-        result = self.requestor.post(API_SERVICE_URL, "/api/authenticate", {
+        result = self.requestor.post(self.requestor.api_service_url, "/api/authenticate", {
             "identifier": username,
             "password": password
         })
         auth_token = result['userToken']
-        auth_requestor = Requestor(auth_token, user_agent=self.requestor.user_agent)
+        auth_requestor = Requestor(
+            auth_token,
+            user_agent=self.requestor.user_agent,
+            api_service_url=self.requestor.api_service_url,
+            data_service_url=self.requestor.data_service_url,
+            serializer=self.requestor.serializer)
         return AuthSession(auth_requestor)
 
 
@@ -318,5 +354,5 @@ class AuthSession(GuestSession):
     def get_user(self, user_id=None):
         if user_id is None:
             user_id = self.get_user_id()
-        result = self.requestor.get(API_SERVICE_URL, '/api/user/{}'.format(user_id))
+        result = self.requestor.get(self.requestor.api_service_url, '/api/user/{}'.format(user_id))
         return UserInfo(result)
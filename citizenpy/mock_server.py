@@ -0,0 +1,341 @@
+"""
+Local stand-in for the Citizen data service.
+
+Serves synthetic (or recorded) payloads for the endpoints used by GuestSession, so the client can be exercised
+and benchmarked without talking to the live *.sp0n.io hosts. Point a Client at it with
+Client(data_service_url=server.url).
+"""
+from datetime import datetime, timedelta, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlsplit, parse_qs
+import argparse
+import gzip
+import json
+import logging
+import random
+import threading
+import time
+
+from citizenpy.timestamp import datetime_to_str_millis
+
+# Synthetic timestamps are offsets from a fixed point in time, so the same seed always produces the same payloads
+SYNTHETIC_EPOCH = datetime(2018, 11, 23, tzinfo=timezone.utc)
+
+
+def make_incident_id(n: int) -> str:
+    """
+    Creates a synthetic incident id
+    :param n: incident number
+    :return: id string
+    """
+    return '{:016x}'.format(n)
+
+
+def make_incident(incident_id: str, updates: int=3, text_size: int=64, rng: random.Random=None) -> dict:
+    """
+    Creates a synthetic incident payload in the shape returned by /gnet/incidents1/batch
+    :param incident_id: id of the incident
+    :param updates: number of updates attached to the incident
+    :param text_size: approximate length of the title and update texts
+    :param rng: random number generator to use
+    :return: incident dict
+    """
+    if rng is None:
+        rng = random.Random(incident_id)
+    created_at = SYNTHETIC_EPOCH - timedelta(seconds=rng.randint(0, 86400), milliseconds=rng.randint(0, 999))
+    created_ms = int(created_at.timestamp() * 1000)
+    incident_updates = {}
+    for i in range(updates):
+        update_id = '{}-{}'.format(incident_id, i)
+        incident_updates[update_id] = {
+            'ts': created_ms + i * 60000,
+            'text': _filler_text(rng, text_size),
+            'id': update_id,
+            'uid': '{:08x}'.format(rng.getrandbits(32)),
+            'hlsReady': False,
+            'hlsDone': False,
+            'hlsVodDone': False,
+            'videoStreamId': '',
+            'dispatcher': {'id': str(rng.randint(1, 100)), 'name': 'Dispatcher'},
+        }
+    latitude = 40.64 + rng.random() * 0.14
+    longitude = -74.05 + rng.random() * 0.1
+    return {
+        'id': incident_id,
+        'title': _filler_text(rng, text_size),
+        'cityCode': 'nyc',
+        'level': rng.randint(0, 3),
+        'neighborhood': 'Midtown',
+        'address': '{} Broadway'.format(rng.randint(1, 2000)),
+        'location': 'New York, NY',
+        'longitude': longitude,
+        'latitude': latitude,
+        'createdAt': datetime_to_str_millis(created_at),
+        'updatedAt': datetime_to_str_millis(created_at + timedelta(minutes=updates)),
+        'updates': incident_updates,
+        'notified': rng.randint(0, 10000),
+        'notifRadiusM': rng.choice([400, 800, 1600]),
+    }
+
+
+def _filler_text(rng: random.Random, size: int) -> str:
+    words = ['police', 'fire', 'report', 'units', 'responding', 'to', 'near', 'street', 'avenue', 'vehicle']
+    text = []
+    length = 0
+    while length < size:
+        word = rng.choice(words)
+        text.append(word)
+        length += len(word) + 1
+    return ' '.join(text)
+
+
+class MockCitizenServer(object):
+    """
+    Threaded HTTP server emulating the Citizen data service
+    """
+    def __init__(self,
+                 host: str='127.0.0.1',
+                 port: int=0,
+                 incident_count: int=1000,
+                 updates_per_incident: int=3,
+                 text_size: int=64,
+                 latency: float=0.0,
+                 error_rate: float=0.0,
+                 fixtures: dict=None,
+                 compression: bool=True,
+                 seed: int=0):
+        """
+        :param host: interface to listen on
+        :param port: port to listen on, 0 picks a free port
+        :param incident_count: number of synthetic incidents returned by the nearby/query endpoints
+        :param updates_per_incident: number of updates attached to every synthetic incident
+        :param text_size: approximate length of synthetic titles and update texts
+        :param latency: delay in seconds added to every response
+        :param error_rate: fraction of requests (0..1) answered with HTTP 500
+        :param fixtures: recorded payloads as a dict of {path: payload}, these take precedence over synthetic data
+        :param compression: gzip responses for clients that send Accept-Encoding: gzip
+        :param seed: random seed used to generate payloads and errors
+        """
+        self.latency = latency
+        self.error_rate = error_rate
+        self.fixtures = fixtures or {}
+        self.compression = compression
+        self.rng = random.Random(seed)
+        self.incident_ids = [make_incident_id(n) for n in range(incident_count)]
+        self.incidents = {
+            incident_id: make_incident(incident_id, updates_per_incident, text_size, self.rng)
+            for incident_id in self.incident_ids
+        }
+        self.updates_per_incident = updates_per_incident
+        self.text_size = text_size
+        self.request_count = 0
+        self._lock = threading.Lock()
+        self.httpd = ThreadingHTTPServer((host, port), _make_handler(self))
+        self.httpd.daemon_threads = True
+        self._thread = None
+
+    @property
+    def url(self) -> str:
+        """
+        :return: base URL of the server, suitable for Client(data_service_url=...)
+        """
+        host, port = self.httpd.server_address[:2]
+        return 'http://{}:{}'.format(host, port)
+
+    def start(self):
+        """
+        Starts serving requests in a background thread
+        :return: self
+        """
+        self._thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        """
+        Stops the server and releases the socket
+        :return:
+        """
+        self.httpd.shutdown()
+        self.httpd.server_close()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.stop()
+
+    def handle(self, method: str, path: str, params: dict, body: dict):
+        """
+        Computes a response for a request
+        :param method: 'GET' or 'POST'
+        :param path: endpoint path
+        :param params: query string parameters
+        :param body: decoded JSON body of a POST request
+        :return: tuple of (status code, payload)
+        """
+        with self._lock:
+            self.request_count += 1
+            failed = self.error_rate > 0 and self.rng.random() < self.error_rate
+        if failed:
+            return 500, {'error': 'Simulated server error'}
+        if path in self.fixtures:
+            return 200, self.fixtures[path]
+        route = _ROUTES.get((method, path))
+        if route is None:
+            return 404, {'error': 'Not found'}
+        return 200, route(self, params, body)
+
+    def _nearby(self, params, body):
+        limit = int(params.get('limit', len(self.incident_ids)))
+        return {'results': self.incident_ids[:limit]}
+
+    def _batch(self, params, body):
+        incident_ids = [i for i in params.get('incidentIds', '').split(',') if i]
+        return {'incidents': [self._get_incident(incident_id) for incident_id in incident_ids]}
+
+    def _query(self, params, body):
+        return {'incidentIds': self.incident_ids}
+
+    def _get_incident(self, incident_id):
+        incident = self.incidents.get(incident_id)
+        if incident is None:
+            incident = make_incident(incident_id, self.updates_per_incident, self.text_size)
+        return incident
+
+    def _leaders(self, params, body):
+        return {'leaders': [
+            {'username': 'user{}'.format(i), 'incidentCount': 100 - i, 'flagCount': i} for i in range(20)
+        ]}
+
+    def _channels(self, params, body):
+        return {'channels': [
+            {
+                'id': str(i),
+                'name': 'Channel {}'.format(i),
+                'department': 'NYPD',
+                'subArea': 'Manhattan',
+                'serviceArea': 'nyc',
+                'clipCount': 2,
+            } for i in range(10)
+        ]}
+
+    def _clips(self, params, body):
+        channels = (body or {}).get('channels') or []
+        return {'clips': [
+            {
+                'channel': channel,
+                'frequency': '460.{}'.format(channel),
+                'wav_url': 'http://localhost/{}/{}.wav'.format(channel, n),
+                'duration_ms': 5000,
+            } for channel in channels for n in range(2)
+        ]}
+
+    def _sub_areas(self, params, body):
+        return {'SubAreas': [{'name': 'Manhattan'}, {'name': 'Brooklyn'}]}
+
+    def _suggested_radius(self, params, body):
+        return {'radius': 1600, 'reason': 'density'}
+
+    def _service_area_code(self, params, body):
+        return {'name': 'New York City', 'code': 'nyc'}
+
+    def _neighborhoods(self, params, body):
+        return {'results': [{'name': 'Midtown', 'city': 'New York', 'state': 'NY'}]}
+
+    def _precincts(self, params, body):
+        return {'results': [{'name': 'Midtown South'}]}
+
+
+_ROUTES = {
+    ('GET', '/v1/incidents/nearby'): MockCitizenServer._nearby,
+    ('GET', '/gnet/incidents1/batch'): MockCitizenServer._batch,
+    ('POST', '/gnet/incidents1/query'): MockCitizenServer._query,
+    ('POST', '/incidents2/query'): MockCitizenServer._query,
+    ('GET', '/radio/leaders'): MockCitizenServer._leaders,
+    ('POST', '/radio/clips'): MockCitizenServer._clips,
+    ('GET', '/radio/sub_areas'): MockCitizenServer._sub_areas,
+    ('GET', '/v2/radio/channels'): MockCitizenServer._channels,
+    ('GET', '/signal/suggested_radius'): MockCitizenServer._suggested_radius,
+    ('GET', '/signal/service_area_code'): MockCitizenServer._service_area_code,
+    ('GET', '/geo/neighborhoods'): MockCitizenServer._neighborhoods,
+    ('GET', '/geo/precincts'): MockCitizenServer._precincts,
+}
+
+
+def _make_handler(server: MockCitizenServer):
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = 'HTTP/1.1'
+
+        def do_GET(self):
+            self._respond('GET', None)
+
+        def do_POST(self):
+            length = int(self.headers.get('Content-Length', 0))
+            body = json.loads(self.rfile.read(length)) if length else None
+            self._respond('POST', body)
+
+        def _respond(self, method, body):
+            url = urlsplit(self.path)
+            params = {k: v[-1] for k, v in parse_qs(url.query).items()}
+            if server.latency > 0:
+                time.sleep(server.latency)
+            status, payload = server.handle(method, url.path, params, body)
+            data = json.dumps(payload).encode('utf-8')
+            self.send_response(status)
+            self.send_header('Content-Type', 'application/json')
+            if server.compression and 'gzip' in self.headers.get('Accept-Encoding', ''):
+                data = gzip.compress(data, compresslevel=6)
+                self.send_header('Content-Encoding', 'gzip')
+            self.send_header('Content-Length', str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+
+        def log_message(self, format, *args):
+            logging.debug('%s - %s', self.address_string(), format % args)
+
+    return Handler
+
+
+def main(host, port, incident_count, updates, text_size, latency, error_rate, fixtures, compression, log_level):
+    logging.basicConfig(level=log_level, format='%(asctime)s [%(levelname)s]:%(message)s')
+    if fixtures:
+        with open(fixtures) as f:
+            fixtures = json.load(f)
+    server = MockCitizenServer(
+        host=host,
+        port=port,
+        incident_count=incident_count,
+        updates_per_incident=updates,
+        text_size=text_size,
+        latency=latency,
+        error_rate=error_rate,
+        fixtures=fixtures,
+        compression=compression)
+    logging.info('Serving mock Citizen data service on %s', server.url)
+    try:
+        server.httpd.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.httpd.server_close()
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Mock Citizen data service')
+    parser.add_argument('--host', default='127.0.0.1', help='Interface to listen on')
+    parser.add_argument('--port', type=int, default=8080, help='Port to listen on')
+    parser.add_argument('--incident-count', type=int, default=1000, help='Number of synthetic incidents')
+    parser.add_argument('--updates', type=int, default=3, help='Number of updates per incident')
+    parser.add_argument('--text-size', type=int, default=64, help='Approximate length of synthetic texts')
+    parser.add_argument('--latency', type=float, default=0.0, help='Delay in seconds added to every response')
+    parser.add_argument('--error-rate', type=float, default=0.0, help='Fraction of requests answered with HTTP 500')
+    parser.add_argument('--fixtures', default=None,
+                        help='JSON file with recorded payloads as {"/endpoint/path": payload}')
+    parser.add_argument('--no-compression', action='store_false', dest='compression',
+                        help='Never gzip responses')
+    parser.add_argument('--log-level', type=int, default=logging.INFO, dest='log_level', help='Sets logging level')
+    main(**parser.parse_args().__dict__)
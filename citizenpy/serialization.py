@@ -0,0 +1,71 @@
+"""
+Pluggable JSON encoding/decoding for API requests and responses.
+
+Serializers work on bytes in both directions, so response bodies are decoded without an intermediate text decode.
+orjson is used when it is installed, otherwise the stdlib json module.
+"""
+from abc import ABC, abstractmethod
+import json
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+class JsonSerializer(ABC):
+    """
+    Base class for JSON serializers
+    """
+    @abstractmethod
+    def loads(self, data: bytes):
+        """
+        Decodes a JSON document
+        :param data: UTF-8 encoded JSON
+        :return: decoded object
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def dumps(self, obj) -> bytes:
+        """
+        Encodes an object as JSON
+        :param obj: object to encode
+        :return: UTF-8 encoded JSON
+        """
+        raise NotImplementedError
+
+
+class StdlibJsonSerializer(JsonSerializer):
+    """
+    Serializer based on the standard json module
+    """
+    def loads(self, data: bytes):
+        return json.loads(data)
+
+    def dumps(self, obj) -> bytes:
+        return json.dumps(obj, separators=(',', ':')).encode('utf-8')
+
+
+class OrjsonSerializer(JsonSerializer):
+    """
+    Serializer based on orjson
+    """
+    def __init__(self):
+        if orjson is None:
+            raise ImportError('orjson is not installed')
+
+    def loads(self, data: bytes):
+        return orjson.loads(data)
+
+    def dumps(self, obj) -> bytes:
+        return orjson.dumps(obj)
+
+
+def default_serializer() -> JsonSerializer:
+    """
+    :return: the fastest serializer available in this environment
+    """
+    if orjson is not None:
+        return OrjsonSerializer()
+    return StdlibJsonSerializer()